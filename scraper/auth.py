@@ -2,6 +2,7 @@
 
 import json
 import logging
+import time
 import webbrowser
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlencode, urlparse, parse_qs
@@ -9,6 +10,11 @@ from pathlib import Path
 from typing import Optional, Dict
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional; token cache falls back to stdlib json
+
 
 logger = logging.getLogger('linkedin_scraper.auth')
 
@@ -17,6 +23,7 @@ class CallbackHandler(BaseHTTPRequestHandler):
     """HTTP handler to catch OAuth callback."""
 
     auth_code = None
+    auth_error = None
 
     def do_GET(self):
         """Handle GET request from OAuth callback."""
@@ -40,6 +47,7 @@ class CallbackHandler(BaseHTTPRequestHandler):
         elif 'error' in query_components:
             error = query_components.get('error', ['Unknown error'])[0]
             error_desc = query_components.get('error_description', [''])[0]
+            CallbackHandler.auth_error = error
             self.send_response(400)
             self.send_header('Content-type', 'text/html')
             self.end_headers()
@@ -67,6 +75,7 @@ class LinkedInAuthenticator:
     AUTH_URL = 'https://www.linkedin.com/oauth/v2/authorization'
     TOKEN_URL = 'https://www.linkedin.com/oauth/v2/accessToken'
     SCOPES = ['openid', 'profile', 'email', 'w_member_social']
+    CALLBACK_TIMEOUT = 300  # Seconds to wait for the OAuth callback
 
     def __init__(self, client_id: str, client_secret: str, redirect_uri: str,
                  token_cache_path: str = 'cache/token.json'):
@@ -105,6 +114,14 @@ class LinkedInAuthenticator:
                 self.access_token = cached_token
                 return cached_token
 
+            # Cached token missing or expired — try the refresh-token grant
+            # before falling back to the full browser flow
+            refreshed_token = self._refresh_cached_token()
+            if refreshed_token:
+                logger.info("Refreshed access token without browser flow")
+                self.access_token = refreshed_token
+                return refreshed_token
+
         logger.info("Starting OAuth 2.0 authentication flow...")
         auth_code = self._start_oauth_flow()
 
@@ -126,6 +143,12 @@ class LinkedInAuthenticator:
         Returns:
             Authorization code or None
         """
+        # Reset callback state from any previous flow in this process —
+        # otherwise the wait loop below would see the already-consumed code
+        # and return immediately without waiting for a fresh callback
+        CallbackHandler.auth_code = None
+        CallbackHandler.auth_error = None
+
         # Build authorization URL
         params = {
             'response_type': 'code',
@@ -147,11 +170,26 @@ class LinkedInAuthenticator:
 
         logger.info(f"Waiting for callback on http://localhost:{port}/callback ...")
 
-        # Wait for one request (the callback)
-        server.handle_request()
+        # Poll in short intervals instead of blocking indefinitely: if the
+        # user closes the browser tab, the process would otherwise hang
+        # forever (worst in CI/headless runs). Short polls also keep Ctrl-C
+        # responsive between handle_request calls.
+        server.timeout = 5
+        deadline = time.monotonic() + self.CALLBACK_TIMEOUT
+        try:
+            while CallbackHandler.auth_code is None and CallbackHandler.auth_error is None:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"OAuth callback not received within {self.CALLBACK_TIMEOUT}s"
+                    )
+                server.handle_request()
+        finally:
+            server.server_close()
+
+        if CallbackHandler.auth_error:
+            logger.error(f"OAuth callback returned error: {CallbackHandler.auth_error}")
 
-        auth_code = CallbackHandler.auth_code
-        return auth_code
+        return CallbackHandler.auth_code
 
     def _exchange_code_for_token(self, auth_code: str) -> Dict:
         """
@@ -179,28 +217,84 @@ class LinkedInAuthenticator:
             logger.error(f"Failed to exchange code for token: {e}")
             raise
 
+    def _refresh_cached_token(self) -> Optional[str]:
+        """Exchange a cached refresh token for a new access token.
+
+        Returns:
+            New access token, or None if no refresh token is cached or the
+            refresh grant fails (caller falls back to the browser flow).
+        """
+        token_data = self._read_token_file()
+        refresh_token = (token_data or {}).get('refresh_token')
+        if not refresh_token:
+            return None
+
+        data = {
+            'grant_type': 'refresh_token',
+            'refresh_token': refresh_token,
+            'client_id': self.client_id,
+            'client_secret': self.client_secret
+        }
+
+        try:
+            response = requests.post(self.TOKEN_URL, data=data, timeout=30)
+            response.raise_for_status()
+            token = response.json()
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Token refresh failed, falling back to full OAuth flow: {e}")
+            return None
+
+        # LinkedIn may not echo the refresh token back — keep the old one
+        token.setdefault('refresh_token', refresh_token)
+        self._save_token(token)
+        return token.get('access_token')
+
     def _save_token(self, token: Dict):
         """Save token to cache file."""
+        # Record an absolute expiry (with a 60s safety margin) so cache loads
+        # can reject stale tokens instead of burning a 401 round-trip.
+        # LinkedIn tokens default to 60 days when expires_in is absent.
+        token['expires_at'] = time.time() + token.get('expires_in', 5184000) - 60
+
         try:
-            with open(self.token_cache_path, 'w') as f:
-                json.dump(token, f, indent=2)
+            if orjson is not None:
+                self.token_cache_path.write_bytes(
+                    orjson.dumps(token, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(self.token_cache_path, 'w') as f:
+                    json.dump(token, f, indent=2)
             logger.info(f"Token saved to {self.token_cache_path}")
         except Exception as e:
             logger.warning(f"Failed to save token to cache: {e}")
 
-    def _load_cached_token(self) -> Optional[str]:
-        """Load token from cache file if it exists."""
+    def _read_token_file(self) -> Optional[Dict]:
+        """Read the raw cached token dict, or None if missing/unreadable."""
         if not self.token_cache_path.exists():
             return None
 
         try:
+            if orjson is not None:
+                return orjson.loads(self.token_cache_path.read_bytes())
             with open(self.token_cache_path, 'r') as f:
-                token_data = json.load(f)
-                return token_data.get('access_token')
+                return json.load(f)
         except Exception as e:
             logger.warning(f"Failed to load cached token: {e}")
             return None
 
+    def _load_cached_token(self) -> Optional[str]:
+        """Load token from cache file if it exists and hasn't expired."""
+        token_data = self._read_token_file()
+        if not token_data:
+            return None
+
+        expires_at = token_data.get('expires_at')
+        if expires_at and time.time() >= expires_at:
+            logger.info("Cached access token has expired")
+            return None
+
+        return token_data.get('access_token')
+
     def clear_cache(self):
         """Clear cached token."""
         if self.token_cache_path.exists():
@@ -1,21 +1,45 @@
 """LinkedIn API client with rate limiting and error handling."""
 
+import queue
+import threading
 import time
 import logging
 from typing import Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 
 logger = logging.getLogger('linkedin_scraper.client')
 
 
+# Advertise only the compression codecs urllib3 can actually decode here.
+# The API responses are verbose JSON with heavily repeated keys, so transport
+# compression cuts the bytes on the wire several-fold; br/zstd beat gzip when
+# their (optional) decoders are installed.
+_ACCEPT_ENCODING = 'gzip, deflate'
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, ' + _ACCEPT_ENCODING
+except ImportError:
+    pass
+try:
+    import zstandard  # noqa: F401
+    _ACCEPT_ENCODING = 'zstd, ' + _ACCEPT_ENCODING
+except ImportError:
+    pass
+
+
 class LinkedInClient:
     """Client for interacting with LinkedIn API v2."""
 
     BASE_URL = 'https://api.linkedin.com/v2'
     REST_BASE_URL = 'https://api.linkedin.com/rest'
 
+    # Restli projection: only the fields the parse pipeline actually consumes
+    # (plus paging), so pages don't carry the full metadata payload
+    POSTS_PROJECTION = '(elements*(id,author,created,specificContent,reshareContext),paging)'
+
     def __init__(self, access_token: str, config: dict):
         """
         Initialize LinkedIn API client.
@@ -31,22 +55,46 @@ class LinkedInClient:
         self.timeout = config.get('linkedin', {}).get('timeout', 30)
         self.last_request_time = 0
         self.request_count = 0  # Track API requests
+        self._count_lock = threading.Lock()  # request_count is bumped from worker threads
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get standard headers for API requests."""
-        return {
+        # Headers are constant for the lifetime of the client (the token is
+        # immutable per instance), so build the dict exactly once
+        self._headers = {
             'Authorization': f'Bearer {self.access_token}',
             'Content-Type': 'application/json',
             'X-Restli-Protocol-Version': '2.0.0',
-            'LinkedIn-Version': '202401'
+            'LinkedIn-Version': '202401',
+            'Accept-Encoding': _ACCEPT_ENCODING
         }
 
+        # Shared session: reuses TCP+TLS connections across requests instead
+        # of paying a fresh handshake per call (retries stay in _make_request)
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=0
+        ))
+        self._session.headers.update(self._headers)
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get standard headers for API requests (built once in __init__)."""
+        return self._headers
+
     def _wait_for_rate_limit(self):
-        """Implement rate limiting delay."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        """Implement rate limiting delay.
+
+        Uses the monotonic clock — wall-clock time can jump under NTP
+        adjustments, which would produce spurious (or enormous) sleeps.
+        """
+        deadline = self.last_request_time + self.rate_limit_delay
+        delta = deadline - time.monotonic()
+        if delta > 0:
+            time.sleep(delta)
+        # Anchor on the deadline so pacing doesn't drift under back-pressure
+        self.last_request_time = max(deadline, time.monotonic())
 
     def _make_request(self, method: str, url: str, **kwargs) -> Optional[Dict]:
         """
@@ -62,15 +110,13 @@ class LinkedInClient:
         """
         self._wait_for_rate_limit()
 
-        headers = self._get_headers()
-        if 'headers' in kwargs:
-            headers.update(kwargs.pop('headers'))
-
         kwargs['timeout'] = kwargs.get('timeout', self.timeout)
 
         for attempt in range(self.max_retries):
             try:
-                response = requests.request(method, url, headers=headers, **kwargs)
+                # Auth/protocol headers are already on the session; per-call
+                # 'headers' kwargs are merged on top by requests
+                response = self._session.request(method, url, **kwargs)
 
                 if response.status_code == 429:
                     # Rate limited - exponential backoff
@@ -80,7 +126,8 @@ class LinkedInClient:
                     continue
 
                 response.raise_for_status()
-                self.request_count += 1  # Increment request counter
+                with self._count_lock:
+                    self.request_count += 1  # Increment request counter
                 return response.json() if response.content else {}
 
             except RequestException as e:
@@ -111,7 +158,8 @@ class LinkedInClient:
             logger.info(f"Retrieved profile for: {profile.get('name', 'Unknown')}")
         return profile
 
-    def get_user_posts(self, author_urn: str, start: int = 0, count: int = 50) -> Optional[Dict]:
+    def get_user_posts(self, author_urn: str, start: int = 0, count: int = 50,
+                       projection: Optional[str] = POSTS_PROJECTION) -> Optional[Dict]:
         """
         Fetch user's posts with pagination.
 
@@ -119,6 +167,7 @@ class LinkedInClient:
             author_urn: LinkedIn URN for the author (e.g., 'urn:li:person:XXXXX')
             start: Pagination start index
             count: Number of posts to fetch (max 50 per request)
+            projection: Restli field projection (None fetches all fields)
 
         Returns:
             Posts data or None
@@ -132,6 +181,8 @@ class LinkedInClient:
             'start': start,
             'count': min(count, 50)  # LinkedIn max is 50 per request
         }
+        if projection:
+            params['projection'] = projection
 
         logger.info(f"Fetching posts (start={start}, count={count})...")
         response = self._make_request('GET', url, params=params)
@@ -172,11 +223,12 @@ class LinkedInClient:
         """
         try:
             logger.debug(f"Downloading media from {url}")
-            response = requests.get(url, stream=True, timeout=self.timeout)
+            response = self._session.get(url, stream=True, timeout=self.timeout)
             response.raise_for_status()
 
             with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                # 64 KiB chunks keep the Python-level loop short
+                for chunk in response.iter_content(chunk_size=65536):
                     if chunk:
                         f.write(chunk)
 
@@ -187,6 +239,32 @@ class LinkedInClient:
             logger.error(f"Failed to download media from {url}: {e}")
             return False
 
+    def download_media_batch(self, pairs: List[tuple], max_workers: int = 8) -> List[bool]:
+        """
+        Download multiple media files concurrently.
+
+        Media downloads are latency/bandwidth-bound, not CPU-bound, and the
+        CDN serves many connections happily — fanning out over a thread pool
+        turns a serial fetch into a near-linear speedup. All workers share
+        the pooled session, so connections are reused across downloads.
+
+        Args:
+            pairs: List of (url, output_path) tuples
+            max_workers: Maximum concurrent downloads
+
+        Returns:
+            List of booleans, one per pair, in input order
+        """
+        if not pairs:
+            return []
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda pair: self.download_media(pair[0], pair[1]), pairs
+            ))
+
     def get_all_posts(self, author_urn: str, limit: Optional[int] = None) -> List[Dict]:
         """
         Fetch all posts from user with pagination.
@@ -199,33 +277,82 @@ class LinkedInClient:
             List of all posts
         """
         all_posts = []
-        start = 0
         count = 50
 
-        while True:
-            response = self.get_user_posts(author_urn, start=start, count=count)
+        # Prefetch the next page on a background thread while the caller
+        # processes the current one — hides one network RTT per page. The
+        # single worker keeps request ordering (and rate-limit spacing,
+        # which lives in _make_request) exactly as in the serial version.
+        pages: queue.Queue = queue.Queue(maxsize=1)
+        stop = threading.Event()
 
-            if not response or 'elements' not in response:
-                break
-
-            posts = response['elements']
-            if not posts:
-                break
-
-            all_posts.extend(posts)
-
-            # Check if we've hit the limit
-            if limit and len(all_posts) >= limit:
-                all_posts = all_posts[:limit]
-                break
-
-            # Check if there are more posts
-            paging = response.get('paging', {})
-            if 'links' not in paging or not any(link.get('rel') == 'next' for link in paging['links']):
-                break
+        def _fetch_pages():
+            start = 0
+            next_url = None
+            try:
+                while not stop.is_set():
+                    if next_url:
+                        response = self._make_request('GET', next_url)
+                    else:
+                        response = self.get_user_posts(author_urn, start=start, count=count)
+                    pages.put(response)
+
+                    if not response or not response.get('elements'):
+                        return
+
+                    # Check if there are more posts
+                    paging = response.get('paging', {})
+                    links = paging.get('links') or []
+                    next_link = next(
+                        (link for link in links if link.get('rel') == 'next'), None
+                    )
+                    if next_link is None:
+                        return
+
+                    # Prefer the server's opaque next href over recomputing
+                    # offsets — cursor-stable if posts are added or deleted
+                    # mid-scan
+                    href = next_link.get('href')
+                    if href:
+                        next_url = href if href.startswith('http') else f"https://api.linkedin.com{href}"
+                    else:
+                        next_url = None
+                        start += count
+            finally:
+                pages.put(None)  # End-of-pages sentinel
+
+        worker = threading.Thread(target=_fetch_pages, daemon=True)
+        worker.start()
 
-            start += count
-            logger.info(f"Fetched {len(all_posts)} posts so far...")
+        try:
+            while True:
+                response = pages.get()
+
+                if response is None or 'elements' not in response:
+                    break
+
+                posts = response['elements']
+                if not posts:
+                    break
+
+                all_posts.extend(posts)
+
+                # Check if we've hit the limit
+                if limit and len(all_posts) >= limit:
+                    all_posts = all_posts[:limit]
+                    break
+
+                logger.info(f"Fetched {len(all_posts)} posts so far...")
+        finally:
+            # Unblock the worker if we bailed early (limit hit): it may be
+            # parked on pages.put with the queue full.
+            stop.set()
+            while worker.is_alive():
+                try:
+                    pages.get_nowait()
+                except queue.Empty:
+                    pass
+                worker.join(timeout=0.1)
 
         logger.info(f"Total posts fetched: {len(all_posts)}")
         logger.info(f"API requests made: {self.request_count}")
@@ -5,6 +5,7 @@ import logging
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -18,8 +19,9 @@ from scraper.utils import (
     load_env_vars,
     slugify_post,
     get_unique_slug,
-    create_directory,
     decode_linkedin_timestamp,
+    load_checkpoint,
+    save_checkpoint,
 )
 from scraper.media_downloader import MediaDownloader
 from scraper.markdown_generator import MarkdownGenerator
@@ -32,6 +34,9 @@ logger = logging.getLogger('linkedin_scraper')
 class LinkedInArchiver:
     """Main orchestrator for LinkedIn post archiving."""
 
+    # Persistent {post_id: relative post.md path} cache for fast re-run skips
+    ARCHIVE_INDEX_PATH = 'cache/archive_index.json'
+
     def __init__(self, config_path: str = 'config/config.yaml'):
         """
         Initialize the archiver.
@@ -235,22 +240,67 @@ class LinkedInArchiver:
         # is never overwritten. This protects authored posts and gives idempotent
         # re-scrapes a useful side effect (refreshed reactions/comments).
         existing_index = self._load_existing_posts_index()
-        existing_slugs = [
+
+        # Persistent post-id → relative post.md path cache. On incremental
+        # re-runs (the common case), a cache hit short-circuits straight to
+        # the engagement update — no fingerprinting, slug math, or directory
+        # work for posts already on disk. Lives in cache/ with the other
+        # runtime state (git-ignored), keyed by the LinkedIn post ID.
+        id_cache: dict = load_checkpoint(self.ARCHIVE_INDEX_PATH) or {}
+
+        existing_slugs = {
             p.parent.name for p in self.base_dir.rglob('post.md')
-        ] if self.base_dir.exists() else []
+        } if self.base_dir.exists() else set()
         # Track content fingerprints to detect duplicates within this batch
         content_fingerprints: set = set()
 
-        for post in tqdm(posts, desc=desc):
+        # Phase 1 (sequential): classify posts and assign slugs. Slug math is
+        # cheap and order-dependent, so keeping it serial makes slug
+        # assignment deterministic and lock-free for the parallel phase.
+        # Per-iteration lookups are bound to locals outside the loop.
+        to_archive = []  # (post, post_dir, md_path)
+        base_dir = self.base_dir
+        date_format = self.config['output']['date_format']
+        update_engagement = self.markdown_generator.update_engagement
+
+        def _remember(post_id, md_path: Path) -> None:
+            """Record a post's on-disk location in the id cache."""
+            if not post_id:
+                return
             try:
-                fingerprint = self._content_fingerprint(post.content)
+                id_cache[str(post_id)] = str(md_path.relative_to(self.base_dir))
+            except ValueError:
+                pass  # path outside base_dir — don't cache
 
+        for post in posts:
+            try:
                 # Skip all reposts — only archive originals and articles
                 if post.is_repost():
                     logger.debug(f"Skipping repost: {post.content[:60]}...")
                     stats['skipped_self_reposts'] += 1
                     continue
 
+                # Fast path: this exact post ID was archived on a previous
+                # run. Jump straight to the engagement refresh — skip the
+                # fingerprint, matching, and slug pipeline entirely.
+                cached_rel = id_cache.get(str(post.id)) if post.id else None
+                if cached_rel:
+                    cached_md = base_dir / cached_rel
+                    if cached_md.exists():
+                        update_engagement(
+                            cached_md,
+                            post.reactions,
+                            post.comments,
+                            post_url=post.post_url,
+                            impressions=post.impressions,
+                        )
+                        stats['engagement_updated'] += 1
+                        stats['successful'] += 1
+                        continue
+                    del id_cache[str(post.id)]  # stale entry — fall through
+
+                fingerprint = self._content_fingerprint(post.content)
+
                 # Skip duplicate content (same post seen twice in feed)
                 if fingerprint in content_fingerprints:
                     logger.debug(f"Skipping duplicate: {post.content[:60]}...")
@@ -263,7 +313,8 @@ class LinkedInArchiver:
                 # just refresh engagement and move on. Never rewrite the body.
                 existing_path = self._find_matching_existing_post(post, existing_index)
                 if existing_path is not None:
-                    self.markdown_generator.update_engagement(
+                    _remember(post.id, existing_path)
+                    update_engagement(
                         existing_path,
                         post.reactions,
                         post.comments,
@@ -274,21 +325,21 @@ class LinkedInArchiver:
                     stats['successful'] += 1
                     continue
 
-                # New post — generate slug and archive normally
+                # New post — generate slug and queue for archival
                 base_slug = slugify_post(post.content, post.created_at)
+                # get_unique_slug reserves the chosen slug in the set
                 slug = get_unique_slug(base_slug, existing_slugs)
-                existing_slugs.append(slug)
                 post.slug = slug
 
-                post_date_path = post.created_at.strftime(self.config['output']['date_format'])
-                post_dir = self.base_dir / post_date_path / slug
-                create_directory(post_dir)
-
+                post_date_path = post.created_at.strftime(date_format)
+                post_dir = base_dir / post_date_path / slug
                 md_path = post_dir / 'post.md'
+
                 # Edge case: slug collided with an existing dir not matched above
                 # (e.g. content drifted but slug is identical). Treat as merge.
                 if md_path.exists():
-                    self.markdown_generator.update_engagement(
+                    _remember(post.id, md_path)
+                    update_engagement(
                         md_path,
                         post.reactions,
                         post.comments,
@@ -299,25 +350,67 @@ class LinkedInArchiver:
                     stats['successful'] += 1
                     continue
 
-                # Download media
-                if post.has_media():
-                    downloaded = self.media_downloader.download_media_for_post(post, post_dir)
-                    stats['media_downloaded'] += len(downloaded)
-
-                # Generate markdown
-                success = self.markdown_generator.save_post_markdown(post, md_path)
-
-                if success:
-                    stats['successful'] += 1
-                    stats['new_posts'] += 1
-                else:
-                    stats['failed'] += 1
+                _remember(post.id, md_path)
+                to_archive.append((post, post_dir, md_path))
 
             except Exception as e:
-                logger.error(f"Failed to archive post {post.id}: {e}")
+                logger.error(f"Failed to classify post {post.id}: {e}")
                 stats['failed'] += 1
                 continue
 
+        # Phase 2 (parallel): media download + markdown write. Each post is
+        # independent here (its own directory and files), and the work is
+        # dominated by network and disk I/O, so a bounded thread pool gives a
+        # near-linear speedup on media-heavy archives.
+        max_workers = self.config.get('output', {}).get('archive_workers', 8)
+
+        # Batch-create the shared YYYY/MM date directories once up front, so
+        # each post only needs a single-level mkdir (and save_post_markdown
+        # none at all) instead of walking parents=True per post
+        for date_dir in {post_dir.parent for _, post_dir, _ in to_archive}:
+            date_dir.mkdir(parents=True, exist_ok=True)
+
+        def _archive_one(post, post_dir, md_path) -> dict:
+            """Archive a single post; returns a stats delta."""
+            delta = {'successful': 0, 'failed': 0, 'media_downloaded': 0, 'new_posts': 0}
+
+            post_dir.mkdir(exist_ok=True)
+
+            # Download media
+            if post.has_media():
+                downloaded = self.media_downloader.download_media_for_post(post, post_dir)
+                delta['media_downloaded'] = len(downloaded)
+
+            # Generate markdown
+            if self.markdown_generator.save_post_markdown(post, md_path):
+                delta['successful'] = 1
+                delta['new_posts'] = 1
+            else:
+                delta['failed'] = 1
+
+            return delta
+
+        if to_archive:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_archive_one, post, post_dir, md_path): post
+                    for post, post_dir, md_path in to_archive
+                }
+                for future in tqdm(as_completed(futures), total=len(futures), desc=desc):
+                    post = futures[future]
+                    try:
+                        delta = future.result()
+                        for key, value in delta.items():
+                            stats[key] += value
+                    except Exception as e:
+                        logger.error(f"Failed to archive post {post.id}: {e}")
+                        stats['failed'] += 1
+            self.media_downloader.close_progress()
+            self.media_downloader.save_url_cache()
+
+        # Persist the id → path cache for the next run's fast path
+        save_checkpoint(id_cache, self.ARCHIVE_INDEX_PATH)
+
         # Generate index
         logger.info("Generating index file...")
         index_path = self.base_dir / 'INDEX.md'
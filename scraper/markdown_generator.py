@@ -26,6 +26,9 @@ class MarkdownGenerator:
             config: Configuration dictionary
         """
         self.config = config
+        # One strftime per batch, not per post — every post archived in the
+        # same run shares the same archival date anyway
+        self._archived_at = datetime.now().strftime('%Y-%m-%d')
 
     def generate_post_markdown(self, post: LinkedInPost) -> str:
         """
@@ -76,12 +79,12 @@ class MarkdownGenerator:
         Returns:
             YAML frontmatter string
         """
-        archived_at = datetime.now().strftime('%Y-%m-%d')
-
+        # The fixed fields are emitted as single fused f-strings rather than
+        # one list element per line. Frontmatter stays plain `key: value`
+        # YAML lines on purpose — update_engagement and the site builder do
+        # line-level parsing, so a JSON-style blob is off the table.
         header = [
-            '---',
-            f'date: {post.created_at.strftime("%Y-%m-%d")}',
-            f'post_url: {post.post_url}',
+            f'---\ndate: {post.created_at.strftime("%Y-%m-%d")}\npost_url: {post.post_url}',
         ]
 
         # Exact post time, decoded from the LinkedIn ID in the URL (UTC).
@@ -89,10 +92,7 @@ class MarkdownGenerator:
         if posted_at:
             header.append(f'posted_at: {posted_at.strftime("%Y-%m-%dT%H:%M:%SZ")}')
 
-        header += [
-            f'post_type: {post.post_type}',
-            f'archived_at: {archived_at}',
-        ]
+        header.append(f'post_type: {post.post_type}\narchived_at: {self._archived_at}')
 
         if post.hashtags:
             tags = ', '.join(post.hashtags)
@@ -216,12 +216,11 @@ class MarkdownGenerator:
         try:
             markdown_content = self.generate_post_markdown(post)
 
-            # Ensure parent directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Caller creates the post directory (batched in the archive
+            # loop) — no redundant mkdir syscall per post here
 
-            # Write markdown file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            # Write markdown file (single write, no handle bookkeeping)
+            output_path.write_text(markdown_content, encoding='utf-8')
 
             logger.info(f"Saved markdown: {output_path}")
             return True
@@ -355,33 +354,44 @@ class MarkdownGenerator:
                 '## Posts by Year\n'
             ]
 
-            # Group posts by year
-            posts_by_year = {}
+            # One sort, one pass: posts sorted newest-first mean years appear
+            # in descending order as we go, so no second grouping/sort pass.
+            # strftime is the per-row cost that remains, and its output only
+            # varies by month — so month/path prefixes are memoized and the
+            # day is formatted with a plain f-string.
+            month_cache: dict = {}
+            current_year = None
             for post in sorted(posts, key=lambda p: p.created_at, reverse=True):
-                year = post.created_at.year
-                if year not in posts_by_year:
-                    posts_by_year[year] = []
-                posts_by_year[year].append(post)
-
-            # Generate index entries
-            for year in sorted(posts_by_year.keys(), reverse=True):
-                sections.append(f'### {year}\n')
-                for post in posts_by_year[year]:
-                    date_str = post.created_at.strftime('%B %d')
-                    preview = post.content[:100] if post.content else '[No content]'
-                    if len(post.content) > 100:
-                        preview += '...'
-
-                    # Generate relative path to post
-                    post_path = f"{post.created_at.strftime('%Y/%m')}/{post.slug}/post.md"
-
-                    sections.append(f'- **{date_str}**: [{preview}]({post_path})')
-
-                sections.append('')
+                created = post.created_at
+                year = created.year
+                if year != current_year:
+                    if current_year is not None:
+                        sections.append('')
+                    sections.append(f'### {year}\n')
+                    current_year = year
+
+                key = (year, created.month)
+                cached = month_cache.get(key)
+                if cached is None:
+                    cached = (created.strftime('%B'), created.strftime('%Y/%m'))
+                    month_cache[key] = cached
+                month_name, year_month = cached
+                date_str = f'{month_name} {created.day:02d}'
+                # Single slice; the 101st char tells us whether to ellipsize
+                # without walking the full content a second time
+                preview = (post.content or '[No content]')[:101]
+                if len(preview) == 101:
+                    preview = preview[:100] + '...'
+
+                # Generate relative path to post
+                post_path = f"{year_month}/{post.slug}/post.md"
+
+                sections.append(f'- **{date_str}**: [{preview}]({post_path})')
+
+            sections.append('')
 
             # Write index file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(sections))
+            output_path.write_text('\n'.join(sections), encoding='utf-8')
 
             logger.info(f"Generated index: {output_path}")
             return True
@@ -5,9 +5,18 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Media:
-    """Represents a media attachment (image, video, or document)."""
+    """Represents a media attachment (image, video, or document).
+
+    slots=True: these objects are created once per media item / post in the
+    archive hot loops, so fixed slots cut per-instance memory (no __dict__)
+    and speed up attribute access.
+    """
+
+    # Shared validation singleton — one hash probe per construction instead
+    # of a fresh list allocation and linear scan
+    VALID_TYPES = frozenset(('image', 'video', 'document'))
 
     type: str  # 'image', 'video', 'document'
     url: str
@@ -16,14 +25,22 @@ class Media:
 
     def __post_init__(self):
         """Validate media type."""
-        valid_types = ['image', 'video', 'document']
-        if self.type not in valid_types:
-            raise ValueError(f"Media type must be one of {valid_types}, got: {self.type}")
+        if self.type not in Media.VALID_TYPES:
+            raise ValueError(
+                f"Media type must be one of {sorted(Media.VALID_TYPES)}, got: {self.type}"
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkedInPost:
-    """Represents a LinkedIn post with all its metadata."""
+    """Represents a LinkedIn post with all its metadata.
+
+    slots=True for the same reason as Media. Not frozen: slug is assigned
+    during archiving and engagement counts are refreshed on re-scrapes, so
+    posts are mutated after construction by design.
+    """
+
+    VALID_POST_TYPES = frozenset(('original', 'repost', 'article', 'poll'))
 
     id: str
     post_url: str
@@ -43,9 +60,11 @@ class LinkedInPost:
 
     def __post_init__(self):
         """Validate post type."""
-        valid_types = ['original', 'repost', 'article', 'poll']
-        if self.post_type not in valid_types:
-            raise ValueError(f"Post type must be one of {valid_types}, got: {self.post_type}")
+        if self.post_type not in LinkedInPost.VALID_POST_TYPES:
+            raise ValueError(
+                f"Post type must be one of {sorted(LinkedInPost.VALID_POST_TYPES)}, "
+                f"got: {self.post_type}"
+            )
 
     def is_repost(self) -> bool:
         """Check if this is a repost."""
